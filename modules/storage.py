@@ -1,327 +1,505 @@
-"""
-Data Storage Module for XScanner
-Handles CSV export and future MongoDB/Notion integration
-"""
-
-import csv
-import json
-import os
-from datetime import datetime
-from pathlib import Path
-import pandas as pd
-
-
-class DataStorage:
-    def __init__(self, config):
-        self.config = config
-        self.storage_config = config.get('storage', {})
-        self.csv_path = self.storage_config.get('csv_path', 'data/results')
-        self.ensure_directories()
-    
-    def ensure_directories(self):
-        """Create necessary directories"""
-        Path(self.csv_path).mkdir(parents=True, exist_ok=True)
-        Path('data').mkdir(exist_ok=True)
-    
-    def save_results(self, classified_data):
-        """Save classified results to CSV files"""
-        if not classified_data:
-            print("⚠️ No data to save")
-            return
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Separate airdrops and startups
-        airdrops = [item for item in classified_data if item['type'] == 'airdrop']
-        startups = [item for item in classified_data if item['type'] == 'startup']
-        
-        # Save airdrops
-        if airdrops:
-            airdrop_file = f"{self.csv_path}/airdrops_{timestamp}.csv"
-            self._save_to_csv(airdrops, airdrop_file, 'airdrop')
-            print(f"💰 Saved {len(airdrops)} airdrops to {airdrop_file}")
-        
-        # Save startups
-        if startups:
-            startup_file = f"{self.csv_path}/startups_{timestamp}.csv"
-            self._save_to_csv(startups, startup_file, 'startup')
-            print(f"🚀 Saved {len(startups)} startups to {startup_file}")
-        
-        # Save combined results
-        combined_file = f"{self.csv_path}/combined_{timestamp}.csv"
-        self._save_to_csv(classified_data, combined_file, 'combined')
-        print(f"📊 Saved {len(classified_data)} total results to {combined_file}")
-        
-        # Save summary statistics
-        self._save_summary(classified_data, timestamp)
-        
-        return {
-            'airdrops': len(airdrops),
-            'startups': len(startups),
-            'total': len(classified_data),
-            'files': {
-                'airdrops': airdrop_file if airdrops else None,
-                'startups': startup_file if startups else None,
-                'combined': combined_file
-            }
-        }
-    
-    def _save_to_csv(self, data, filename, data_type):
-        """Save data to CSV with appropriate columns"""
-        if not data:
-            return
-        
-        # Define columns based on type
-        if data_type == 'airdrop':
-            columns = [
-                'project_name', 'chain', 'category', 'confidence', 'website',
-                'description', 'key_features', 'author', 'author_followers',
-                'engagement', 'tweet_url', 'created_at', 'original_text', 'reasoning'
-            ]
-        elif data_type == 'startup':
-            columns = [
-                'project_name', 'chain', 'category', 'funding_amount', 'investors',
-                'confidence', 'website', 'description', 'key_features', 
-                'author', 'author_followers', 'engagement', 'tweet_url', 
-                'created_at', 'original_text', 'reasoning'
-            ]
-        else:  # combined
-            columns = [
-                'type', 'project_name', 'chain', 'category', 'funding_amount',
-                'investors', 'confidence', 'website', 'description', 'key_features',
-                'author', 'author_followers', 'engagement', 'tweet_url',
-                'created_at', 'original_text', 'reasoning'
-            ]
-        
-        # Prepare data for CSV
-        csv_data = []
-        for item in data:
-            row = {}
-            for col in columns:
-                value = item.get(col)
-                
-                # Handle list fields
-                if isinstance(value, list):
-                    row[col] = '; '.join(value) if value else ''
-                # Handle None values
-                elif value is None:
-                    row[col] = ''
-                else:
-                    row[col] = str(value)
-            
-            csv_data.append(row)
-        
-        # Write to CSV
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=columns)
-            writer.writeheader()
-            writer.writerows(csv_data)
-    
-    def _save_summary(self, data, timestamp):
-        """Save summary statistics"""
-        summary = {
-            'scan_timestamp': timestamp,
-            'total_items': len(data),
-            'airdrops': len([item for item in data if item['type'] == 'airdrop']),
-            'startups': len([item for item in data if item['type'] == 'startup']),
-            'top_chains': self._get_top_chains(data),
-            'top_categories': self._get_top_categories(data),
-            'high_engagement': len([item for item in data if item.get('engagement', 0) > 100]),
-            'verified_authors': len([item for item in data if item.get('author_followers', 0) > 10000])
-        }
-        
-        summary_file = f"{self.csv_path}/summary_{timestamp}.json"
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2)
-    
-    def _get_top_chains(self, data):
-        """Get most mentioned chains"""
-        chains = {}
-        for item in data:
-            chain = item.get('chain')
-            if chain:
-                chains[chain] = chains.get(chain, 0) + 1
-        return sorted(chains.items(), key=lambda x: x[1], reverse=True)[:5]
-    
-    def _get_top_categories(self, data):
-        """Get most common categories"""
-        categories = {}
-        for item in data:
-            category = item.get('category')
-            if category:
-                categories[category] = categories.get(category, 0) + 1
-        return sorted(categories.items(), key=lambda x: x[1], reverse=True)[:5]
-    
-    def get_output_path(self):
-        """Return the output directory path"""
-        return os.path.abspath(self.csv_path)
-    
-    def load_historical_data(self, days_back=7):
-        """Load historical data from CSV files"""
-        try:
-            historical_data = []
-            csv_files = Path(self.csv_path).glob("combined_*.csv")
-            
-            for file_path in sorted(csv_files)[-days_back:]:  # Last N files
-                df = pd.read_csv(file_path)
-                historical_data.extend(df.to_dict('records'))
-            
-            return historical_data
-        except Exception as e:
-            print(f"Error loading historical data: {e}")
-            return []
-    
-    def export_to_notion(self, data):
-        """Export data to Notion (future implementation)"""
-        # TODO: Implement Notion API integration
-        print("🔧 Notion export not implemented yet")
-        pass
-    
-    def export_to_mongodb(self, data):
-        """Export data to MongoDB (future implementation)"""
-        # TODO: Implement MongoDB integration
-        print("🔧 MongoDB export not implemented yet")
-        pass
-    
-    def export_to_telegram(self, data):
-        """Send summary to Telegram (future implementation)"""
-        # TODO: Implement Telegram bot integration
-        print("🔧 Telegram export not implemented yet")
-        pass
-    
-    def get_analytics(self, data):
-        """Generate analytics from the data"""
-        if not data:
-            return {}
-        
-        analytics = {
-            'total_opportunities': len(data),
-            'airdrops_vs_startups': {
-                'airdrops': len([item for item in data if item['type'] == 'airdrop']),
-                'startups': len([item for item in data if item['type'] == 'startup'])
-            },
-            'confidence_distribution': {
-                'high': len([item for item in data if item.get('confidence', 0) > 0.8]),
-                'medium': len([item for item in data if 0.6 < item.get('confidence', 0) <= 0.8]),
-                'low': len([item for item in data if item.get('confidence', 0) <= 0.6])
-            },
-            'engagement_stats': {
-                'high_engagement': len([item for item in data if item.get('engagement', 0) > 500]),
-                'medium_engagement': len([item for item in data if 100 < item.get('engagement', 0) <= 500]),
-                'low_engagement': len([item for item in data if item.get('engagement', 0) <= 100])
-            },
-            'top_chains': self._get_top_chains(data),
-            'top_categories': self._get_top_categories(data),
-            'funding_insights': self._analyze_funding(data)
-        }
-        
-        return analytics
-    
-    def _analyze_funding(self, data):
-        """Analyze funding-related data"""
-        funded_projects = [item for item in data if item.get('funding_amount')]
-        
-        if not funded_projects:
-            return {'total_funded': 0}
-        
-        return {
-            'total_funded': len(funded_projects),
-            'avg_confidence': sum(item.get('confidence', 0) for item in funded_projects) / len(funded_projects),
-            'top_investors': self._get_top_investors(funded_projects)
-        }
-    
-    def _get_top_investors(self, data):
-        """Get most active investors"""
-        investors = {}
-        for item in data:
-            investor_list = item.get('investors', [])
-            if isinstance(investor_list, str):
-                investor_list = investor_list.split(';')
-            
-            for investor in investor_list:
-                investor = investor.strip()
-                if investor:
-                    investors[investor] = investors.get(investor, 0) + 1
-        
-        return sorted(investors.items(), key=lambda x: x[1], reverse=True)[:5]
-
-
-# Utility functions for data management
-class DataManager:
-    """Additional utilities for managing XScanner data"""
-    
-    def __init__(self, storage_path='data/results'):
-        self.storage_path = storage_path
-    
-    def merge_csv_files(self, pattern="combined_*.csv", output_file=None):
-        """Merge multiple CSV files into one"""
-        if not output_file:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"{self.storage_path}/merged_{timestamp}.csv"
-        
-        csv_files = list(Path(self.storage_path).glob(pattern))
-        if not csv_files:
-            print("No CSV files found to merge")
-            return
-        
-        combined_df = pd.concat([pd.read_csv(f) for f in csv_files], ignore_index=True)
-        combined_df.drop_duplicates(subset=['tweet_url'], keep='first', inplace=True)
-        combined_df.to_csv(output_file, index=False)
-        
-        print(f"📊 Merged {len(csv_files)} files into {output_file}")
-        print(f"📈 Total unique records: {len(combined_df)}")
-        
-        return output_file
-    
-    def clean_old_files(self, days_to_keep=30):
-        """Remove old CSV files"""
-        cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-        removed_count = 0
-        
-        for file_path in Path(self.storage_path).glob("*.csv"):
-            file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-            if file_time < cutoff_date:
-                file_path.unlink()
-                removed_count += 1
-        
-        print(f"🧹 Cleaned {removed_count} old files")
-    
-    def generate_report(self, days_back=7):
-        """Generate a summary report"""
-        storage = DataStorage({'storage': {'csv_path': self.storage_path}})
-        historical_data = storage.load_historical_data(days_back)
-        
-        if not historical_data:
-            print("No historical data found")
-            return
-        
-        analytics = storage.get_analytics(historical_data)
-        
-        # Generate markdown report
-        report = f"""# XScanner Report
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Data Period: Last {days_back} scans
-
-## Summary
-- **Total Opportunities**: {analytics['total_opportunities']}
-- **Airdrops**: {analytics['airdrops_vs_startups']['airdrops']}
-- **Startups**: {analytics['airdrops_vs_startups']['startups']}
-
-## Top Chains
-{chr(10).join([f"- {chain}: {count}" for chain, count in analytics['top_chains']])}
-
-## Top Categories  
-{chr(10).join([f"- {cat}: {count}" for cat, count in analytics['top_categories']])}
-
-## Engagement Distribution
-- High (>500): {analytics['engagement_stats']['high_engagement']}
-- Medium (100-500): {analytics['engagement_stats']['medium_engagement']}
-- Low (<100): {analytics['engagement_stats']['low_engagement']}
-"""
-        
-        report_file = f"{self.storage_path}/report_{datetime.now().strftime('%Y%m%d')}.md"
-        with open(report_file, 'w') as f:
-            f.write(report)
-        
-        print(f"📝 Report generated: {report_file}")
+"""
+Data Storage Module for XScanner
+Handles CSV export and future MongoDB/Notion integration
+"""
+
+import csv
+import json
+import os
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+import pandas as pd
+
+try:
+    import orjson  # Fast C JSON encoder (optional)
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa  # Arrow CSV reader/writer (optional)
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+
+class DataStorage:
+    # CSV column layouts per result type
+    AIRDROP_COLUMNS = [
+        'project_name', 'chain', 'category', 'confidence', 'website',
+        'description', 'key_features', 'author', 'author_followers',
+        'engagement', 'tweet_url', 'created_at', 'original_text', 'reasoning'
+    ]
+    STARTUP_COLUMNS = [
+        'project_name', 'chain', 'category', 'funding_amount', 'investors',
+        'confidence', 'website', 'description', 'key_features',
+        'author', 'author_followers', 'engagement', 'tweet_url',
+        'created_at', 'original_text', 'reasoning'
+    ]
+    COMBINED_COLUMNS = [
+        'type', 'project_name', 'chain', 'category', 'funding_amount',
+        'investors', 'confidence', 'website', 'description', 'key_features',
+        'author', 'author_followers', 'engagement', 'tweet_url',
+        'created_at', 'original_text', 'reasoning'
+    ]
+
+    def __init__(self, config):
+        self.config = config
+        self.storage_config = config.get('storage', {})
+        self.csv_path = self.storage_config.get('csv_path', 'data/results')
+        self._csv_path_obj = Path(self.csv_path)
+        self.ensure_directories()
+
+    def ensure_directories(self):
+        """Create necessary directories"""
+        self._csv_path_obj.mkdir(parents=True, exist_ok=True)
+        Path('data').mkdir(exist_ok=True)
+    
+    def save_results(self, classified_data):
+        """Save classified results to CSV files"""
+        if not classified_data:
+            print("⚠️ No data to save")
+            return
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # Build one DataFrame and slice it per type (single pass over the data)
+        df = self._to_dataframe(classified_data)
+        airdrops = df[df['type'] == 'airdrop']
+        startups = df[df['type'] == 'startup']
+
+        # Save airdrops
+        airdrop_file = None
+        if len(airdrops):
+            airdrop_file = self._csv_path_obj / f"airdrops_{timestamp}.csv"
+            self._write_csv(airdrops, self.AIRDROP_COLUMNS, airdrop_file)
+            print(f"💰 Saved {len(airdrops)} airdrops to {airdrop_file}")
+
+        # Save startups
+        startup_file = None
+        if len(startups):
+            startup_file = self._csv_path_obj / f"startups_{timestamp}.csv"
+            self._write_csv(startups, self.STARTUP_COLUMNS, startup_file)
+            print(f"🚀 Saved {len(startups)} startups to {startup_file}")
+
+        # Save combined results
+        combined_file = self._csv_path_obj / f"combined_{timestamp}.csv"
+        self._write_csv(df, self.COMBINED_COLUMNS, combined_file)
+        print(f"📊 Saved {len(df)} total results to {combined_file}")
+
+        # Optional Parquet copy for fast historical reloads
+        if 'parquet' in self.storage_config.get('export_formats', []):
+            self._write_parquet(df, self._csv_path_obj / f"combined_{timestamp}.parquet")
+
+        # Save summary statistics
+        self._save_summary(classified_data, timestamp)
+
+        return {
+            'airdrops': len(airdrops),
+            'startups': len(startups),
+            'total': len(classified_data),
+            'files': {
+                'airdrops': airdrop_file,
+                'startups': startup_file,
+                'combined': combined_file
+            }
+        }
+
+    @staticmethod
+    def _to_dataframe(data):
+        """Build a DataFrame with list columns joined and None as empty string"""
+        df = pd.DataFrame(data)
+        for col in df.columns:
+            if df[col].map(lambda v: isinstance(v, list)).any():
+                df[col] = df[col].map(lambda v: '; '.join(v) if isinstance(v, list) else v)
+        return df
+
+    @staticmethod
+    def _write_csv(df, columns, filename):
+        """Write a DataFrame to CSV with a fixed column layout"""
+        df.reindex(columns=columns).fillna('').to_csv(
+            filename, index=False, encoding='utf-8')
+
+    @staticmethod
+    def _write_parquet(df, filename):
+        """Write a DataFrame to Parquet (requires pyarrow)"""
+        try:
+            df.to_parquet(filename, engine='pyarrow', compression='zstd')
+        except (ImportError, ValueError) as e:
+            print(f"⚠️ Parquet export unavailable: {e}")
+
+    # --- Streaming writers: rows go to disk as classifications arrive, ---
+    # --- so memory stays flat regardless of scan size.                 ---
+
+    _STREAM_LAYOUTS = {
+        'airdrop': ('airdrops', AIRDROP_COLUMNS),
+        'startup': ('startups', STARTUP_COLUMNS),
+        'combined': ('combined', COMBINED_COLUMNS)
+    }
+
+    def open_writers(self, timestamp=None):
+        """Start a streaming scan; files are created lazily on first row"""
+        self._stream_ts = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._stream_writers = {}
+        self._stream_stats = self._new_stats()
+        return self._stream_ts
+
+    def _stream_writer(self, kind):
+        """Get (or lazily open) the CSV writer for a result type"""
+        entry = self._stream_writers.get(kind)
+        if entry is None:
+            prefix, columns = self._STREAM_LAYOUTS[kind]
+            filename = self._csv_path_obj / f"{prefix}_{self._stream_ts}.csv"
+            handle = open(filename, 'w', newline='', encoding='utf-8')
+            writer = csv.DictWriter(handle, fieldnames=columns,
+                                    extrasaction='ignore', restval='')
+            writer.writeheader()
+            entry = (handle, writer, filename)
+            self._stream_writers[kind] = entry
+        return entry[1]
+
+    def write_row(self, item):
+        """Stream one classified item to the appropriate CSV files"""
+        row = self._to_row(item)
+        if item['type'] in ('airdrop', 'startup'):
+            self._stream_writer(item['type']).writerow(row)
+        self._stream_writer('combined').writerow(row)
+        self._update_stats(self._stream_stats, item)
+
+    def close_writers(self):
+        """Close streaming writers, write the summary, and report totals"""
+        files = {'airdrops': None, 'startups': None, 'combined': None}
+        for kind, (handle, _, filename) in self._stream_writers.items():
+            handle.close()
+            prefix = self._STREAM_LAYOUTS[kind][0]
+            files[prefix] = filename
+
+        stats = self._finalize_stats(self._stream_stats)
+        if stats['total']:
+            self._write_summary(stats, self._stream_ts)
+
+        self._stream_writers = {}
+        return {
+            'airdrops': stats['airdrops'],
+            'startups': stats['startups'],
+            'total': stats['total'],
+            'files': files
+        }
+
+    @staticmethod
+    def _to_row(item):
+        """Flatten one classified item for CSV output"""
+        row = {}
+        for key, value in item.items():
+            if isinstance(value, list):
+                row[key] = '; '.join(value) if value else ''
+            elif value is None:
+                row[key] = ''
+            else:
+                row[key] = value
+        return row
+    
+    def _save_summary(self, data, timestamp):
+        """Save summary statistics"""
+        self._write_summary(self._summarize(data), timestamp)
+
+    def _write_summary(self, stats, timestamp):
+        """Write already-aggregated summary statistics to JSON"""
+        summary = {
+            'scan_timestamp': timestamp,
+            'total_items': stats['total'],
+            'airdrops': stats['airdrops'],
+            'startups': stats['startups'],
+            'top_chains': stats['top_chains'],
+            'top_categories': stats['top_categories'],
+            'high_engagement': stats['engagement_over_100'],
+            'verified_authors': stats['verified_authors']
+        }
+
+        summary_file = self._csv_path_obj / f"summary_{timestamp}.json"
+        if orjson:
+            with open(summary_file, 'wb') as f:
+                f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+        else:
+            with open(summary_file, 'w') as f:
+                json.dump(summary, f, indent=2)
+
+    @staticmethod
+    def _new_stats():
+        """Fresh accumulator for single-pass summary statistics"""
+        return {
+            'total': 0, 'airdrops': 0, 'startups': 0,
+            'chains': Counter(), 'categories': Counter(), 'investors': Counter(),
+            'engagement_over_100': 0, 'verified_authors': 0,
+            'conf_high': 0, 'conf_medium': 0, 'conf_low': 0,
+            'eng_high': 0, 'eng_medium': 0, 'eng_low': 0,
+            'funded': 0, 'funded_confidence_sum': 0.0
+        }
+
+    @staticmethod
+    def _update_stats(stats, item):
+        """Fold one classified item into the accumulator"""
+        stats['total'] += 1
+
+        item_type = item.get('type')
+        if item_type == 'airdrop':
+            stats['airdrops'] += 1
+        elif item_type == 'startup':
+            stats['startups'] += 1
+
+        chain = item.get('chain')
+        if chain:
+            stats['chains'][chain] += 1
+        category = item.get('category')
+        if category:
+            stats['categories'][category] += 1
+
+        engagement = item.get('engagement', 0)
+        if engagement > 500:
+            stats['eng_high'] += 1
+        elif engagement > 100:
+            stats['eng_medium'] += 1
+        else:
+            stats['eng_low'] += 1
+        if engagement > 100:
+            stats['engagement_over_100'] += 1
+
+        if item.get('author_followers', 0) > 10000:
+            stats['verified_authors'] += 1
+
+        confidence = item.get('confidence', 0)
+        if confidence > 0.8:
+            stats['conf_high'] += 1
+        elif confidence > 0.6:
+            stats['conf_medium'] += 1
+        else:
+            stats['conf_low'] += 1
+
+        if item.get('funding_amount'):
+            stats['funded'] += 1
+            stats['funded_confidence_sum'] += confidence
+            investor_list = item.get('investors', [])
+            if isinstance(investor_list, str):
+                investor_list = investor_list.split(';')
+            for investor in investor_list:
+                investor = investor.strip()
+                if investor:
+                    stats['investors'][investor] += 1
+
+    @staticmethod
+    def _finalize_stats(stats):
+        """Turn the accumulator into the summary dict used by callers"""
+        return {
+            'total': stats['total'],
+            'airdrops': stats['airdrops'],
+            'startups': stats['startups'],
+            'top_chains': stats['chains'].most_common(5),
+            'top_categories': stats['categories'].most_common(5),
+            'top_investors': stats['investors'].most_common(5),
+            'engagement_over_100': stats['engagement_over_100'],
+            'verified_authors': stats['verified_authors'],
+            'confidence_buckets': (stats['conf_high'], stats['conf_medium'], stats['conf_low']),
+            'engagement_buckets': (stats['eng_high'], stats['eng_medium'], stats['eng_low']),
+            'funded': stats['funded'],
+            'funded_confidence_sum': stats['funded_confidence_sum']
+        }
+
+    def _summarize(self, data):
+        """Aggregate all summary/analytics counters in a single pass"""
+        stats = self._new_stats()
+        for item in data:
+            self._update_stats(stats, item)
+        return self._finalize_stats(stats)
+    
+    def get_output_path(self):
+        """Return the output directory path"""
+        return os.path.abspath(self.csv_path)
+    
+    def load_historical_data(self, days_back=7):
+        """Load historical data, preferring Parquet over legacy CSV files"""
+        try:
+            historical_data = []
+            parquet_files = sorted(self._csv_path_obj.glob("combined_*.parquet"))
+
+            if parquet_files:
+                for file_path in parquet_files[-days_back:]:  # Last N files
+                    df = pd.read_parquet(file_path)
+                    historical_data.extend(df.to_dict('records'))
+                return historical_data
+
+            # Fall back to CSV for scans made before Parquet export existed
+            csv_files = self._csv_path_obj.glob("combined_*.csv")
+            for file_path in sorted(csv_files)[-days_back:]:  # Last N files
+                df = pd.read_csv(file_path)
+                historical_data.extend(df.to_dict('records'))
+
+            return historical_data
+        except Exception as e:
+            print(f"Error loading historical data: {e}")
+            return []
+    
+    def export_to_notion(self, data):
+        """Export data to Notion (future implementation)"""
+        # TODO: Implement Notion API integration
+        print("🔧 Notion export not implemented yet")
+        pass
+    
+    def export_to_mongodb(self, data):
+        """Export data to MongoDB (future implementation)"""
+        # TODO: Implement MongoDB integration
+        print("🔧 MongoDB export not implemented yet")
+        pass
+    
+    def export_to_telegram(self, data):
+        """Send summary to Telegram (future implementation)"""
+        # TODO: Implement Telegram bot integration
+        print("🔧 Telegram export not implemented yet")
+        pass
+    
+    def get_analytics(self, data):
+        """Generate analytics from the data"""
+        if not data:
+            return {}
+
+        stats = self._summarize(data)
+        conf_high, conf_medium, conf_low = stats['confidence_buckets']
+        eng_high, eng_medium, eng_low = stats['engagement_buckets']
+
+        if stats['funded']:
+            funding_insights = {
+                'total_funded': stats['funded'],
+                'avg_confidence': stats['funded_confidence_sum'] / stats['funded'],
+                'top_investors': stats['top_investors']
+            }
+        else:
+            funding_insights = {'total_funded': 0}
+
+        return {
+            'total_opportunities': stats['total'],
+            'airdrops_vs_startups': {
+                'airdrops': stats['airdrops'],
+                'startups': stats['startups']
+            },
+            'confidence_distribution': {
+                'high': conf_high,
+                'medium': conf_medium,
+                'low': conf_low
+            },
+            'engagement_stats': {
+                'high_engagement': eng_high,
+                'medium_engagement': eng_medium,
+                'low_engagement': eng_low
+            },
+            'top_chains': stats['top_chains'],
+            'top_categories': stats['top_categories'],
+            'funding_insights': funding_insights
+        }
+
+
+# Utility functions for data management
+class DataManager:
+    """Additional utilities for managing XScanner data"""
+    
+    def __init__(self, storage_path='data/results'):
+        self.storage_path = storage_path
+        self._path_obj = Path(storage_path)
+    
+    def merge_csv_files(self, pattern="combined_*.csv", output_file=None):
+        """Merge multiple CSV files into one"""
+        if not output_file:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_file = f"{self.storage_path}/merged_{timestamp}.csv"
+        
+        csv_files = list(self._path_obj.glob(pattern))
+        if not csv_files:
+            print("No CSV files found to merge")
+            return
+        
+        if pa is not None:
+            total = self._merge_with_arrow(csv_files, output_file)
+        else:
+            combined_df = pd.concat([pd.read_csv(f) for f in csv_files], ignore_index=True)
+            combined_df.drop_duplicates(subset=['tweet_url'], keep='first', inplace=True)
+            combined_df.to_csv(output_file, index=False)
+            total = len(combined_df)
+
+        print(f"📊 Merged {len(csv_files)} files into {output_file}")
+        print(f"📈 Total unique records: {total}")
+
+        return output_file
+
+    @staticmethod
+    def _merge_with_arrow(csv_files, output_file):
+        """Merge CSV files via pyarrow's multi-threaded reader"""
+        tables = [pacsv.read_csv(f) for f in csv_files]
+        try:
+            table = pa.concat_tables(tables, promote_options='permissive')
+        except TypeError:
+            # pyarrow < 14 spells the permissive schema merge differently
+            table = pa.concat_tables(tables, promote=True)
+        table = table.combine_chunks()
+
+        # Keep the first occurrence of each tweet_url
+        seen = set()
+        keep = []
+        for index, url in enumerate(table.column('tweet_url').to_pylist()):
+            if url not in seen:
+                seen.add(url)
+                keep.append(index)
+        table = table.take(keep)
+
+        pacsv.write_csv(table, output_file)
+        return table.num_rows
+    
+    def clean_old_files(self, days_to_keep=30):
+        """Remove old CSV files"""
+        cutoff_date = datetime.now() - timedelta(days=days_to_keep)
+        removed_count = 0
+        
+        for file_path in self._path_obj.glob("*.csv"):
+            file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
+            if file_time < cutoff_date:
+                file_path.unlink()
+                removed_count += 1
+        
+        print(f"🧹 Cleaned {removed_count} old files")
+    
+    def generate_report(self, days_back=7):
+        """Generate a summary report"""
+        storage = DataStorage({'storage': {'csv_path': self.storage_path}})
+        historical_data = storage.load_historical_data(days_back)
+        
+        if not historical_data:
+            print("No historical data found")
+            return
+        
+        analytics = storage.get_analytics(historical_data)
+        
+        # Generate markdown report
+        report = f"""# XScanner Report
+Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Data Period: Last {days_back} scans
+
+## Summary
+- **Total Opportunities**: {analytics['total_opportunities']}
+- **Airdrops**: {analytics['airdrops_vs_startups']['airdrops']}
+- **Startups**: {analytics['airdrops_vs_startups']['startups']}
+
+## Top Chains
+{chr(10).join([f"- {chain}: {count}" for chain, count in analytics['top_chains']])}
+
+## Top Categories  
+{chr(10).join([f"- {cat}: {count}" for cat, count in analytics['top_categories']])}
+
+## Engagement Distribution
+- High (>500): {analytics['engagement_stats']['high_engagement']}
+- Medium (100-500): {analytics['engagement_stats']['medium_engagement']}
+- Low (<100): {analytics['engagement_stats']['low_engagement']}
+"""
+        
+        report_file = f"{self.storage_path}/report_{datetime.now().strftime('%Y%m%d')}.md"
+        with open(report_file, 'w') as f:
+            f.write(report)
+        
+        print(f"📝 Report generated: {report_file}")
         return report_file
\ No newline at end of file
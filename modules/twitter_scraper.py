@@ -1,195 +1,524 @@
-"""
-Twitter Scraper Module for XScanner
-Fetches tweets using snscrape (no API key needed) or X API v2
-"""
-
-import asyncio
-import json
-from datetime import datetime, timedelta
-from pathlib import Path
-import subprocess
-import sys
-
-
-class TwitterScraper:
-    def __init__(self, config):
-        self.config = config
-        self.twitter_config = config.get('twitter', {})
-        self.hashtags = self.twitter_config.get('hashtags', [])
-        self.max_tweets = self.twitter_config.get('max_tweets', 100)
-        self.days_back = self.twitter_config.get('days_back', 1)
-        
-        # Load influencer accounts if available
-        self.influencer_accounts = self._load_influencers()
-    
-    def _load_influencers(self):
-        """Load influencer accounts from file"""
-        try:
-            with open('data/influencers.txt', 'r') as file:
-                return [line.strip() for line in file if line.strip()]
-        except FileNotFoundError:
-            return []
-    
-    async def fetch_tweets(self):
-        """Main method to fetch tweets"""
-        try:
-            # Try snscrape first (no API key needed)
-            return await self._fetch_with_snscrape()
-        except Exception as e:
-            print(f"⚠️ snscrape failed: {e}")
-            # Fallback to X API if available
-            return await self._fetch_with_xapi()
-    
-    async def _fetch_with_snscrape(self):
-        """Fetch tweets using snscrape"""
-        tweets = []
-        since_date = (datetime.now() - timedelta(days=self.days_back)).strftime('%Y-%m-%d')
-        
-        # Search by hashtags
-        for hashtag in self.hashtags:
-            query = f"{hashtag} since:{since_date}"
-            tweets.extend(await self._run_snscrape_search(query, self.max_tweets // len(self.hashtags)))
-        
-        # Search influencer accounts
-        for account in self.influencer_accounts[:5]:  # Limit to avoid rate limits
-            query = f"from:{account} since:{since_date}"
-            tweets.extend(await self._run_snscrape_search(query, 20))
-        
-        return self._deduplicate_tweets(tweets)
-    
-    async def _run_snscrape_search(self, query, limit):
-        """Run snscrape command and parse results"""
-        try:
-            cmd = [
-                sys.executable, '-m', 'snscrape', '--jsonl', '--max-results', str(limit),
-                'twitter-search', query
-            ]
-            
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode != 0:
-                print(f"snscrape error: {stderr.decode()}")
-                return []
-            
-            tweets = []
-            for line in stdout.decode().strip().split('\n'):
-                if line:
-                    try:
-                        tweet_data = json.loads(line)
-                        tweets.append(self._format_tweet(tweet_data))
-                    except json.JSONDecodeError:
-                        continue
-            
-            return tweets
-            
-        except Exception as e:
-            print(f"Error running snscrape: {e}")
-            return []
-    
-    async def _fetch_with_xapi(self):
-        """Fetch tweets using X API v2 (if API key is provided)"""
-        api_key = self.twitter_config.get('api_key')
-        if not api_key:
-            print("⚠️ No X API key provided, using mock data")
-            return self._get_mock_tweets()
-        
-        # TODO: Implement X API v2 integration
-        print("🔧 X API v2 integration not implemented yet, using mock data")
-        return self._get_mock_tweets()
-    
-    def _format_tweet(self, raw_tweet):
-        """Format tweet data into standardized structure"""
-        return {
-            'id': raw_tweet.get('id'),
-            'text': raw_tweet.get('rawContent', raw_tweet.get('content', '')),
-            'author': raw_tweet.get('user', {}).get('username'),
-            'author_followers': raw_tweet.get('user', {}).get('followersCount', 0),
-            'created_at': raw_tweet.get('date'),
-            'retweets': raw_tweet.get('retweetCount', 0),
-            'likes': raw_tweet.get('likeCount', 0),
-            'url': raw_tweet.get('url', ''),
-            'raw_data': raw_tweet
-        }
-    
-    def _deduplicate_tweets(self, tweets):
-        """Remove duplicate tweets based on ID"""
-        seen = set()
-        unique_tweets = []
-        
-        for tweet in tweets:
-            if tweet['id'] not in seen:
-                seen.add(tweet['id'])
-                unique_tweets.append(tweet)
-        
-        return unique_tweets[:self.max_tweets]
-    
-    def _get_mock_tweets(self):
-        """Mock tweets for testing when APIs are unavailable"""
-        return [
-            {
-                'id': '1',
-                'text': '🚀 Exciting news! LayerZero is launching a massive #airdrop campaign. Early supporters get 2x rewards! Connect your wallet at layerzero.network #crypto #DeFi',
-                'author': 'cryptowhale',
-                'author_followers': 50000,
-                'created_at': datetime.now().isoformat(),
-                'retweets': 245,
-                'likes': 892,
-                'url': 'https://twitter.com/cryptowhale/status/1'
-            },
-            {
-                'id': '2',
-                'text': '📢 BREAKING: Polygon Labs just closed a $15M Series A round led by Sequoia Capital! Building the future of Web3 infrastructure on Ethereum. 🔥 #funding #polygon #ethereum',
-                'author': 'web3insider',
-                'author_followers': 25000,
-                'created_at': datetime.now().isoformat(),
-                'retweets': 156,
-                'likes': 423,
-                'url': 'https://twitter.com/web3insider/status/2'
-            },
-            {
-                'id': '3',
-                'text': '🎯 New project alert! ZkSync Era is giving away tokens to early testnet users. Claim yours before the snapshot! #airdrop #zksync #layer2',
-                'author': 'airdrophunter',
-                'author_followers': 15000,
-                'created_at': datetime.now().isoformat(),
-                'retweets': 89,
-                'likes': 234,
-                'url': 'https://twitter.com/airdrophunter/status/3'
-            },
-            {
-                'id': '4',
-                'text': '💡 Introducing ChainLink 3.0 - revolutionizing oracle networks with AI-powered data feeds. Pre-seed round opening soon. Interested VCs, DM us! #startup #oracle #AI',
-                'author': 'chainlink_team',
-                'author_followers': 100000,
-                'created_at': datetime.now().isoformat(),
-                'retweets': 445,
-                'likes': 1200,
-                'url': 'https://twitter.com/chainlink_team/status/4'
-            },
-            {
-                'id': '5',
-                'text': 'Just had my coffee ☕ and thinking about the weekend plans. Maybe visit the beach 🏖️ #life #weekend',
-                'author': 'randomuser',
-                'author_followers': 100,
-                'created_at': datetime.now().isoformat(),
-                'retweets': 2,
-                'likes': 5,
-                'url': 'https://twitter.com/randomuser/status/5'
-            }
-        ]
-
-
-# Installation helper
-def install_snscrape():
-    """Install snscrape if not available"""
-    try:
-        subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'snscrape'])
-        print("✅ snscrape installed successfully")
-    except subprocess.CalledProcessError:
-        print("❌ Failed to install snscrape")
\ No newline at end of file
+"""
+Twitter Scraper Module for XScanner
+Fetches tweets using snscrape (no API key needed) or X API v2
+"""
+
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import pickle
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+import subprocess
+import sys
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+try:
+    import orjson  # Fast C JSON codec (optional)
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads  # also accepts bytes, like orjson
+
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+try:
+    import numba  # JIT for the scoring kernel (optional)
+except ImportError:
+    numba = None
+
+try:
+    from snscrape.modules import twitter as sntwitter  # in-process scraping
+except ImportError:
+    sntwitter = None
+
+try:
+    from pybloom_live import ScalableBloomFilter  # cross-run dedup (optional)
+except ImportError:
+    ScalableBloomFilter = None
+
+
+def _engagement_scores(followers, retweets, likes):
+    """Engagement score per tweet: log-damped reach plus weighted interactions"""
+    return 0.5 * np.log1p(followers) + retweets + 2.0 * likes
+
+
+if numba is not None:
+    # Compiled variant; cached to disk so the compile cost is paid once
+    _engagement_scores = numba.njit(cache=True)(_engagement_scores)
+
+
+_parse_iso = datetime.fromisoformat  # C-implemented; far cheaper than strptime
+
+
+def _normalize_date(value):
+    """Canonicalize a backend timestamp to ISO-8601, passing junk through"""
+    if not value:
+        return value
+    try:
+        return _parse_iso(value).isoformat()
+    except (TypeError, ValueError):
+        return value  # unrecognized format; keep the raw string
+
+
+@functools.lru_cache(maxsize=1)
+def _load_influencers_cached(path, mtime):
+    """Parse the influencer list; cached until the file's mtime changes"""
+    return tuple(sys.intern(line.strip())
+                 for line in Path(path).read_text().splitlines() if line.strip())
+
+
+class TwitterScraper:
+    def __init__(self, config):
+        self.config = config
+        self.twitter_config = config.get('twitter', {})
+        # Frozen, interned search terms: these feed tight query-building
+        # loops, and interning makes later comparisons pointer-level
+        self.hashtags = tuple(sys.intern(hashtag)
+                              for hashtag in self.twitter_config.get('hashtags', []))
+        self.max_tweets = self.twitter_config.get('max_tweets', 100)
+        self.days_back = self.twitter_config.get('days_back', 1)
+        self.max_influencers = self.twitter_config.get('max_influencers', 5)
+        
+        # Load influencer accounts if available
+        self.influencer_accounts = self._load_influencers()
+
+        # Approximate membership of tweet IDs seen in previous runs
+        self._bloom_path = Path('data/tweet_ids.bloom')
+        self._id_bloom = self._load_id_bloom()
+
+        # Lowercased hashtag bytes for prefiltering raw subprocess output
+        self._kw_bytes = tuple({hashtag.lstrip('#').lower().encode('utf-8')
+                                for hashtag in self.hashtags if hashtag.lstrip('#')})
+
+        # Short-lived cache of query results (RAM + disk) so overlapping
+        # runs don't re-fetch the same tweet windows
+        self.query_cache_ttl = self.twitter_config.get('query_cache_ttl', 300)
+        self._query_cache_dir = Path('data/query_cache')
+        self._query_mem_cache = {}
+        if self.query_cache_ttl:
+            self._prune_query_cache()
+    
+    def _load_id_bloom(self):
+        """Load (or create) the persistent Bloom filter of seen tweet IDs"""
+        if ScalableBloomFilter is None:
+            return None
+        try:
+            with open(self._bloom_path, 'rb') as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning("⚠️ Could not load tweet ID filter: %s", e)
+        return ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-6)
+
+    def save_seen_ids(self):
+        """Persist the Bloom filter so the next run skips known tweets"""
+        if self._id_bloom is None:
+            return
+        try:
+            self._bloom_path.parent.mkdir(exist_ok=True)
+            with open(self._bloom_path, 'wb') as file:
+                pickle.dump(self._id_bloom, file)
+        except Exception as e:
+            log.warning("⚠️ Could not save tweet ID filter: %s", e)
+
+    def _load_influencers(self):
+        """Load influencer accounts from file (cached across instances)"""
+        path = 'data/influencers.txt'
+        try:
+            mtime = Path(path).stat().st_mtime
+        except FileNotFoundError:
+            return ()
+        return _load_influencers_cached(path, mtime)
+    
+    async def fetch_tweets(self):
+        """Main method to fetch tweets"""
+        try:
+            # Try snscrape first (no API key needed)
+            tweets = await self._fetch_with_snscrape()
+        except Exception as e:
+            log.warning("⚠️ snscrape failed: %s", e)
+            # Fallback to X API if available
+            return await self._fetch_with_xapi()
+        self.save_seen_ids()
+        return tweets
+    
+    async def _fetch_with_snscrape(self):
+        """Fetch tweets using snscrape, running all queries concurrently"""
+        if not self.hashtags and not self.influencer_accounts:
+            return []
+
+        since_date = (datetime.now() - timedelta(days=self.days_back)).strftime('%Y-%m-%d')
+        since_clause = f" since:{since_date}"
+
+        # Combine the search terms with OR so a handful of queries covers
+        # everything, instead of one scrape session per hashtag/account
+        queries = []
+        if self.hashtags:
+            queries.append(("(" + " OR ".join(self.hashtags) + ")" + since_clause,
+                            self.max_tweets))
+        # Limit accounts per run to avoid rate limits
+        accounts = self.influencer_accounts[:self.max_influencers]
+        for group in self._chunk_accounts(accounts, 8):
+            from_terms = " OR ".join("from:" + account for account in group)
+            queries.append(("(" + from_terms + ")" + since_clause, 20 * len(group)))
+
+        # Cap in-flight scrapes: each query pins a thread or subprocess, so
+        # running more of them than cores just adds contention
+        semaphore = asyncio.Semaphore(min(8, os.cpu_count() or 4))
+
+        async def bounded_search(query, limit):
+            async with semaphore:
+                try:
+                    return await self._run_snscrape_search(query, limit)
+                except Exception as e:
+                    log.warning("⚠️ snscrape query failed: %s", e)
+                    return []
+
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(bounded_search(query, limit))
+                     for query, limit in queries]
+
+        tweets = []
+        for task in tasks:
+            tweets.extend(task.result())
+
+        return self._rank_tweets(self._deduplicate_tweets(tweets))
+
+    @staticmethod
+    def _chunk_accounts(accounts, size):
+        """Yield accounts in groups small enough for one OR-query"""
+        for start in range(0, len(accounts), size):
+            yield accounts[start:start + size]
+
+    @staticmethod
+    def _rank_tweets(tweets):
+        """Order tweets by engagement score, highest first
+
+        The numeric fields are pulled into parallel numpy arrays so the
+        scoring itself runs vectorized (or Numba-compiled) instead of as a
+        per-tweet Python loop.
+        """
+        if len(tweets) < 2:
+            return tweets
+
+        count = len(tweets)
+        followers = np.fromiter((t['author_followers'] or 0 for t in tweets),
+                                dtype=np.int64, count=count)
+        retweets = np.fromiter((t['retweets'] or 0 for t in tweets),
+                               dtype=np.int64, count=count)
+        likes = np.fromiter((t['likes'] or 0 for t in tweets),
+                            dtype=np.int64, count=count)
+
+        scores = _engagement_scores(followers, retweets, likes)
+        order = np.argsort(-scores, kind='stable')
+        return [tweets[i] for i in order]
+
+    async def _run_snscrape_search(self, query, limit):
+        """Search tweets, serving recent identical queries from cache"""
+        cached = self._query_cache_get(query, limit)
+        if cached is not None:
+            return cached
+
+        if sntwitter is not None:
+            tweets = await asyncio.to_thread(self._scrape_sync, query, limit)
+        else:
+            # Library not importable; shell out to the module instead
+            tweets = await self._run_snscrape_subprocess(query, limit)
+
+        if tweets:
+            self._query_cache_put(query, limit, tweets)
+        return tweets
+
+    @staticmethod
+    def _query_cache_key(query, limit):
+        """Stable filename-safe key for a (query, limit) pair"""
+        return hashlib.sha1(f"{query}|{limit}".encode('utf-8')).hexdigest()
+
+    def _query_cache_get(self, query, limit):
+        """Return cached results for a query if still within the TTL"""
+        if not self.query_cache_ttl:
+            return None
+
+        key = self._query_cache_key(query, limit)
+        entry = self._query_mem_cache.get(key)
+        if entry and time.time() - entry[0] < self.query_cache_ttl:
+            return entry[1]
+
+        path = self._query_cache_dir / f"{key}.json"
+        try:
+            mtime = path.stat().st_mtime
+            if time.time() - mtime < self.query_cache_ttl:
+                tweets = _loads(path.read_bytes())
+                self._query_mem_cache[key] = (mtime, tweets)
+                return tweets
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _query_cache_put(self, query, limit, tweets):
+        """Store query results in memory and atomically on disk"""
+        if not self.query_cache_ttl:
+            return
+
+        key = self._query_cache_key(query, limit)
+        self._query_mem_cache[key] = (time.time(), tweets)
+        try:
+            self._query_cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._query_cache_dir / f"{key}.json.tmp"
+            tmp_path.write_bytes(_dumps(tweets))
+            os.replace(tmp_path, self._query_cache_dir / f"{key}.json")
+        except Exception as e:
+            log.warning("⚠️ Could not cache query results: %s", e)
+
+    def _prune_query_cache(self):
+        """Drop expired cache files so the directory stays bounded"""
+        cutoff = time.time() - self.query_cache_ttl
+        try:
+            for path in self._query_cache_dir.glob("*.json"):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def _scrape_sync(self, query, limit):
+        """Scrape with the snscrape library in-process (runs in a thread)
+
+        Avoids the per-query cost of spawning a fresh interpreter and
+        re-importing snscrape in a subprocess.
+        """
+        tweets = []
+        try:
+            for index, tweet in enumerate(sntwitter.TwitterSearchScraper(query).get_items()):
+                if index >= limit:
+                    break
+                user = getattr(tweet, 'user', None)
+                tweets.append(self._format_tweet({
+                    'id': str(tweet.id),
+                    'rawContent': getattr(tweet, 'rawContent', getattr(tweet, 'content', '')),
+                    'user': {
+                        'username': getattr(user, 'username', None),
+                        'followersCount': getattr(user, 'followersCount', 0) or 0
+                    },
+                    'date': tweet.date.isoformat() if getattr(tweet, 'date', None) else None,
+                    'retweetCount': getattr(tweet, 'retweetCount', 0) or 0,
+                    'likeCount': getattr(tweet, 'likeCount', 0) or 0,
+                    'url': getattr(tweet, 'url', '')
+                }))
+        except Exception:
+            log.exception("Error scraping '%s' in-process", query)
+        return tweets
+
+    async def _run_snscrape_subprocess(self, query, limit):
+        """Run snscrape as a subprocess and parse its JSONL output"""
+        try:
+            cmd = [
+                sys.executable, '-m', 'snscrape', '--jsonl', '--max-results', str(limit),
+                'twitter-search', query
+            ]
+            
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=1 << 20  # snscrape JSONL lines can exceed the 64 KiB default
+            )
+
+            # Drain stderr concurrently so the child never blocks on a full pipe
+            stderr_task = asyncio.create_task(process.stderr.read())
+
+            # For keyword searches the matched term must appear somewhere in
+            # the payload, so a raw-bytes scan (Boyer-Moore in C) can reject
+            # a line before paying for a full JSON parse. from: queries are
+            # exempt: their tweets need not mention any keyword.
+            kw_bytes = () if 'from:' in query else self._kw_bytes
+
+            # Parse stdout line by line as snscrape produces it, instead of
+            # buffering the whole output with communicate()
+            tweets = []
+            async for line in process.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                if kw_bytes:
+                    probe = line.lower()
+                    if not any(kw in probe for kw in kw_bytes):
+                        continue
+                try:
+                    tweets.append(self._format_tweet(_loads(line)))
+                except ValueError:
+                    continue
+
+            await process.wait()
+            stderr = await stderr_task
+
+            if process.returncode != 0:
+                if log.isEnabledFor(logging.ERROR):
+                    # Only pay for the decode when the message will be emitted
+                    log.error("snscrape error: %s", stderr.decode())
+                return []
+
+            return tweets
+
+        except Exception:
+            log.exception("Error running snscrape")
+            return []
+    
+    async def _fetch_with_xapi(self):
+        """Fetch tweets using X API v2 (if API key is provided)"""
+        api_key = self.twitter_config.get('api_key')
+        if not api_key:
+            log.warning("⚠️ No X API key provided, using mock data")
+            return self._get_mock_tweets()
+        
+        # TODO: Implement X API v2 integration
+        log.info("🔧 X API v2 integration not implemented yet, using mock data")
+        return self._get_mock_tweets()
+    
+    _EMPTY_USER = {}
+
+    def _format_tweet(self, raw_tweet):
+        """Format tweet data into standardized structure
+
+        Tweets stay plain dicts: the classifier, storage, and README all
+        treat them as mappings, and CPython already shares one key table
+        across dicts built with this literal. Authors repeat heavily
+        (influencer feeds), so that field is interned to a single object.
+        """
+        user = raw_tweet.get('user') or self._EMPTY_USER
+        author = user.get('username')
+        tweet = {
+            'id': raw_tweet.get('id'),
+            'text': raw_tweet.get('rawContent') or raw_tweet.get('content', ''),
+            'author': sys.intern(author) if author else author,
+            'author_followers': user.get('followersCount', 0),
+            'created_at': _normalize_date(raw_tweet.get('date')),
+            'retweets': raw_tweet.get('retweetCount', 0),
+            'likes': raw_tweet.get('likeCount', 0),
+            'url': raw_tweet.get('url', '')
+        }
+        # Keeping the raw payload roughly doubles per-tweet memory, so it
+        # is only retained when explicitly debugging
+        if self.config.get('debug'):
+            tweet['raw_data'] = raw_tweet
+        return tweet
+    
+    def _deduplicate_tweets(self, tweets):
+        """Remove duplicate tweets based on ID, keeping first occurrence"""
+        unique_tweets = self._first_occurrences(tweets)[:self.max_tweets]
+
+        # Drop tweets already seen in previous runs (approximate, ~1e-6 FP)
+        if self._id_bloom is not None:
+            fresh = [t for t in unique_tweets if t['id'] not in self._id_bloom]
+            dropped = len(unique_tweets) - len(fresh)
+            if dropped:
+                log.info("🧹 Skipped %d tweets seen in previous runs", dropped)
+            for tweet in fresh:
+                self._id_bloom.add(tweet['id'])
+            unique_tweets = fresh
+
+        return unique_tweets
+
+    @staticmethod
+    def _first_occurrences(tweets):
+        """First occurrence of each tweet ID, vectorized when IDs are numeric
+
+        Snowflake IDs fit in uint64, so the common path packs them into one
+        array and lets np.unique find duplicates in C instead of hashing
+        every ID string in Python.
+        """
+        try:
+            ids = np.fromiter((int(tweet['id']) for tweet in tweets),
+                              dtype=np.uint64, count=len(tweets))
+        except (TypeError, ValueError, OverflowError):
+            # Non-numeric IDs (custom backends): fall back to a dict pass
+            seen = {}
+            for tweet in tweets:
+                seen.setdefault(tweet['id'], tweet)
+            return list(seen.values())
+
+        _, index = np.unique(ids, return_index=True)
+        index.sort()  # np.unique orders by value; restore arrival order
+        return [tweets[i] for i in index]
+
+    def _get_mock_tweets(self):
+        """Mock tweets for testing when APIs are unavailable"""
+        now = datetime.now().isoformat()
+        return [dict(tweet, created_at=now) for tweet in _MOCK_TWEETS]
+
+
+# Static mock tweets used when no scraping backend is available; built once
+# at import, with created_at stamped per call in _get_mock_tweets
+_MOCK_TWEETS = (
+    {
+        'id': '1',
+        'text': '🚀 Exciting news! LayerZero is launching a massive #airdrop campaign. Early supporters get 2x rewards! Connect your wallet at layerzero.network #crypto #DeFi',
+        'author': 'cryptowhale',
+        'author_followers': 50000,
+        'retweets': 245,
+        'likes': 892,
+        'url': 'https://twitter.com/cryptowhale/status/1'
+    },
+    {
+        'id': '2',
+        'text': '📢 BREAKING: Polygon Labs just closed a $15M Series A round led by Sequoia Capital! Building the future of Web3 infrastructure on Ethereum. 🔥 #funding #polygon #ethereum',
+        'author': 'web3insider',
+        'author_followers': 25000,
+        'retweets': 156,
+        'likes': 423,
+        'url': 'https://twitter.com/web3insider/status/2'
+    },
+    {
+        'id': '3',
+        'text': '🎯 New project alert! ZkSync Era is giving away tokens to early testnet users. Claim yours before the snapshot! #airdrop #zksync #layer2',
+        'author': 'airdrophunter',
+        'author_followers': 15000,
+        'retweets': 89,
+        'likes': 234,
+        'url': 'https://twitter.com/airdrophunter/status/3'
+    },
+    {
+        'id': '4',
+        'text': '💡 Introducing ChainLink 3.0 - revolutionizing oracle networks with AI-powered data feeds. Pre-seed round opening soon. Interested VCs, DM us! #startup #oracle #AI',
+        'author': 'chainlink_team',
+        'author_followers': 100000,
+        'retweets': 445,
+        'likes': 1200,
+        'url': 'https://twitter.com/chainlink_team/status/4'
+    },
+    {
+        'id': '5',
+        'text': 'Just had my coffee ☕ and thinking about the weekend plans. Maybe visit the beach 🏖️ #life #weekend',
+        'author': 'randomuser',
+        'author_followers': 100,
+        'retweets': 2,
+        'likes': 5,
+        'url': 'https://twitter.com/randomuser/status/5'
+    }
+)
+
+
+# Installation helper
+def install_snscrape():
+    """Install snscrape if not available"""
+    if importlib.util.find_spec('snscrape') is not None:
+        return  # already installed; skip the multi-second pip startup
+    try:
+        subprocess.run(
+            [sys.executable, '-m', 'pip', 'install', '--quiet',
+             '--disable-pip-version-check', '--no-input', 'snscrape'],
+            check=True
+        )
+        log.info("✅ snscrape installed successfully")
+    except subprocess.CalledProcessError:
+        log.error("❌ Failed to install snscrape")
\ No newline at end of file